@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Create placeholder PWA icons for Photo Collector
+Generates the icons/ SVG set and a helper page for converting them to PNG
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ICON_SIZES = [72, 96, 128, 144, 152, 192, 384, 512]
+
+def create_placeholder_icons():
+    """Create placeholder SVG icons for the PWA manifest"""
+
+    icons_dir = Path('icons')
+    icons_dir.mkdir(exist_ok=True)
+
+    print("Creating placeholder icons...")
+
+    def write_icon(size):
+        svg_content = f'''<svg width="{size}" height="{size}" viewBox="0 0 {size} {size}" xmlns="http://www.w3.org/2000/svg">
+  <defs>
+    <linearGradient id="grad" x1="0%" y1="0%" x2="100%" y2="100%">
+      <stop offset="0%" style="stop-color:#667eea;stop-opacity:1" />
+      <stop offset="100%" style="stop-color:#764ba2;stop-opacity:1" />
+    </linearGradient>
+  </defs>
+  <rect width="{size}" height="{size}" rx="{size * 0.2}" fill="url(#grad)"/>
+  <circle cx="{size // 2}" cy="{size // 2}" r="{size * 0.25}" fill="rgba(255,255,255,0.9)" stroke="rgba(255,255,255,0.5)" stroke-width="{max(2, size * 0.02)}"/>
+  <text x="{size // 2}" y="{size * 0.605}" text-anchor="middle" font-family="Arial" font-size="{size * 0.3}" fill="rgba(255,255,255,0.9)" font-weight="bold">PC</text>
+</svg>'''
+
+        svg_file = icons_dir / f'icon-{size}x{size}.svg'
+
+        # Each SVG is under 1 KB, so write it in one shot through a raw fd
+        # instead of going through the buffered text-IO stack
+        data = svg_content.encode('ascii')
+        fd = os.open(str(svg_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+        return svg_file
+
+    # Overlap the per-file open/write/close latency across a thread pool,
+    # then print in order once everything is on disk
+    with ThreadPoolExecutor(max_workers=min(8, len(ICON_SIZES))) as executor:
+        for svg_file in executor.map(write_icon, ICON_SIZES):
+            print(f"Created {svg_file}")
+
+# The per-icon grid item only varies by the size, so keep it as one
+# pre-encoded bytes template (\xc3\x97 is the UTF-8 multiplication sign)
+# and let %-formatting fill in the numbers
+_ICON_ITEM_TMPL = (
+    b'        <div class="icon-item">\n'
+    b'            <img src="icons/icon-%dx%d.svg" alt="%dx%d icon">\n'
+    b'            <div><strong>%d\xc3\x97%d</strong></div>\n'
+    b'        </div>\n'
+)
+
+def create_converter_page():
+    """Create an HTML page for converting the SVG icons to PNG"""
+
+    # Accumulate pre-encoded fragments in a bytearray and flush once
+    buf = bytearray('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Convert Icons to PNG</title>
+    <style>
+        body { font-family: system-ui; max-width: 1200px; margin: 0 auto; padding: 20px; background: #f5f6fa; }
+        .icons-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 20px; }
+        .icon-item { background: white; padding: 20px; border-radius: 12px; text-align: center; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        .icon-item img { width: 100%; height: auto; border-radius: 8px; }
+        .download-btn { margin-top: 10px; padding: 8px 16px; background: #667eea; color: white; border: none; border-radius: 6px; cursor: pointer; }
+        .instructions { background: white; padding: 20px; border-radius: 12px; margin-bottom: 20px; }
+    </style>
+</head>
+<body>
+    <h1>Convert PWA Icons to PNG</h1>
+
+    <div class="instructions">
+        <h2>Instructions</h2>
+        <p><strong>Method 1 (Quick):</strong> Right-click each icon below and "Save Image As" and change extension to .png</p>
+        <p><strong>Method 2 (Online):</strong> Download SVGs and convert at convertio.co</p>
+    </div>
+
+    <div class="icons-grid">
+'''.encode('utf-8'))
+
+    for size in ICON_SIZES:
+        buf += _ICON_ITEM_TMPL % (size, size, size, size, size, size)
+
+    buf += b'''    </div>
+</body>
+</html>'''
+
+    Path('convert-icons.html').write_bytes(buf)
+
+    print("Created convert-icons.html")
+
+if __name__ == '__main__':
+    try:
+        create_placeholder_icons()
+        create_converter_page()
+        print()
+        print("Icons ready! Open convert-icons.html to save PNG versions.")
+    except Exception as e:
+        print(f"Error: {e}")
+        print("Make sure you're running this from the photo-collector directory")
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+iPhone Debug Server for Photo Collector
+Serves the app over plain HTTP with verbose device logging to diagnose
+iOS Safari issues (camera permissions, PWA install, asset loading).
+"""
+
+import os
+import re
+import sys
+import shutil
+import socket
+import hashlib
+import mimetypes
+import time
+from functools import lru_cache
+from collections import namedtuple
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+# Compile once at import - these run on every logged request
+_IOS_RE = re.compile(r'OS (\d+)_(\d+)')
+_SAFARI_RE = re.compile(r'Version/(\d+\.\d+)')
+_UA_RE = re.compile(
+    r'(?P<iphone>iPhone)|(?P<ipad>iPad)|(?P<android>Android)|'
+    r'(?P<crios>CriOS)|(?P<fxios>FxiOS)|(?P<chrome>Chrome)|'
+    r'(?P<firefox>Firefox)|(?P<safari>Safari)'
+)
+
+_ClientInfo = namedtuple('_ClientInfo', 'device ios_version safari_version')
+
+@lru_cache(maxsize=256)
+def _classify(user_agent):
+    """Classify a User-Agent in one pass and cache the result.
+
+    A device sends the same UA on every request, so after the first hit the
+    whole classification is a dict lookup.
+    """
+    hits = {match.lastgroup for match in _UA_RE.finditer(user_agent)}
+
+    if 'iphone' in hits:
+        if 'crios' in hits:
+            device = 'iPhone/Chrome'
+        elif 'fxios' in hits:
+            device = 'iPhone/Firefox'
+        else:
+            device = 'iPhone/Safari'
+    elif 'ipad' in hits:
+        device = 'iPad'
+    elif 'android' in hits:
+        device = 'Android'
+    elif 'chrome' in hits:
+        device = 'Desktop/Chrome'
+    elif 'firefox' in hits:
+        device = 'Desktop/Firefox'
+    elif 'safari' in hits:
+        device = 'Desktop/Safari'
+    else:
+        device = 'Unknown'
+
+    ios_match = _IOS_RE.search(user_agent)
+    ios_version = (int(ios_match.group(1)), int(ios_match.group(2))) if ios_match else None
+    safari_match = _SAFARI_RE.search(user_agent)
+    safari_version = safari_match.group(1) if safari_match else None
+
+    return _ClientInfo(device, ios_version, safari_version)
+
+class iPhoneDebugHandler(SimpleHTTPRequestHandler):
+    # CORS plus no-cache so Safari revalidates every asset while debugging
+    # (no-store would also stop it sending If-None-Match, wasting the 304
+    # path). The block never varies per request, so keep it preformatted
+    # instead of formatting each "k: v" line on every response.
+    _STATIC_HEADERS = (
+        b'Access-Control-Allow-Origin: *\r\n'
+        b'Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n'
+        b'Access-Control-Allow-Headers: *\r\n'
+        # Let browsers cache the preflight result for a day instead of
+        # re-issuing OPTIONS before every cross-origin fetch
+        b'Access-Control-Max-Age: 86400\r\n'
+        b'Cache-Control: no-cache, must-revalidate\r\n'
+        b'Pragma: no-cache\r\n'
+        b'Expires: 0\r\n'
+    )
+
+    # Small static assets preloaded by main(); path -> (bytes, mime, etag)
+    ASSETS = {}
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == '/':
+            path = '/index.html'
+
+        asset = self.ASSETS.get(path)
+        if asset is None:
+            # Not preloaded - serve from disk as usual
+            super().do_GET()
+            return
+
+        data, mime, etag, mtime, file_path = asset
+        # This server promises fresh assets while debugging, so one stat per
+        # hit catches files edited since startup and refreshes the cache -
+        # still far cheaper than the open/read it replaces
+        try:
+            current = os.stat(file_path).st_mtime_ns
+        except OSError:
+            current = None
+        if current != mtime:
+            if current is None:
+                # File vanished - drop it and let the disk path 404
+                self.ASSETS.pop(path, None)
+                super().do_GET()
+                return
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            etag = '"{}"'.format(hashlib.md5(data).hexdigest())
+            self.ASSETS[path] = (data, mime, etag, current, file_path)
+
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', mime)
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def end_headers(self):
+        # HTTP/0.9 responses have no header section (send_header skips them
+        # too), and the buffer is a CPython-private attribute - only append
+        # when it actually exists
+        if self.request_version != 'HTTP/0.9' and hasattr(self, '_headers_buffer'):
+            self._headers_buffer.append(self._STATIC_HEADERS)
+        super().end_headers()
+
+    def do_OPTIONS(self):
+        self.send_response(200)
+        self.end_headers()
+
+    def copyfile(self, source, outputfile):
+        # Plain HTTP, so hand the body transfer to the kernel with
+        # os.sendfile instead of shuttling 16 KB chunks through Python
+        try:
+            if not hasattr(os, 'sendfile'):
+                raise OSError('sendfile not available')
+            infd = source.fileno()
+            outfd = outputfile.fileno()
+            size = os.fstat(infd).st_size
+        except (AttributeError, OSError):
+            shutil.copyfileobj(source, outputfile, 256 * 1024)
+            return
+
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(outfd, infd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+
+    def detect_device(self, user_agent):
+        """Classify the client from its User-Agent header."""
+        return _classify(user_agent).device
+
+    def extract_safari_version(self, user_agent):
+        """Pull the Safari version out of the User-Agent, if present."""
+        return _classify(user_agent).safari_version
+
+    def check_ios_compatibility(self, user_agent):
+        """Warn when the connecting iOS version predates camera/PWA support."""
+        ios_version = _classify(user_agent).ios_version
+        if not ios_version:
+            return
+        major, minor = ios_version
+        if major < 11:
+            print(f"    WARNING: iOS {major}.{minor} - camera access requires iOS 11+")
+        elif major < 13:
+            print(f"    NOTE: iOS {major}.{minor} - PWA install support is limited")
+
+    def log_ios_details(self, user_agent):
+        """Print iOS/Safari version details for iPhone clients."""
+        info = _classify(user_agent)
+        if info.ios_version:
+            print(f"    iOS version: {info.ios_version[0]}.{info.ios_version[1]}")
+        if info.safari_version:
+            print(f"    Safari version: {info.safari_version}")
+
+    def log_message(self, format, *args):
+        # Keep the device tag on the connection - a keep-alive page load logs
+        # 10+ lines for the same client, so only reclassify if the UA changes
+        user_agent = self.headers.get('User-Agent', '')
+        if getattr(self, '_ua', None) != user_agent:
+            self._ua = user_agent
+            self._device_tag = self.detect_device(user_agent)
+        device = self._device_tag
+        # time.strftime skips the datetime object allocation
+        timestamp = time.strftime('%H:%M:%S')
+        print(f"[{timestamp}] {device} {self.client_address[0]} - {format % args}")
+        if device.startswith('iPhone'):
+            self.log_ios_details(user_agent)
+            self.check_ios_compatibility(user_agent)
+
+def preload_assets():
+    """Read the small static PWA files into memory once at startup.
+
+    Serving them from this cache avoids the per-request open/read cycle,
+    and the precomputed ETag lets repeat visitors get a 304. The recorded
+    mtime lets do_GET refresh an entry when the file is edited mid-session.
+    """
+    assets = {}
+    asset_exts = ('.html', '.css', '.js', '.json', '.svg', '.png')
+
+    for folder in ('.', 'icons'):
+        if not os.path.isdir(folder):
+            continue
+        for entry in os.scandir(folder):
+            if not entry.is_file() or not entry.name.endswith(asset_exts):
+                continue
+            stat = entry.stat()
+            if stat.st_size > 1024 * 1024:
+                continue
+            with open(entry.path, 'rb') as f:
+                data = f.read()
+            mime = mimetypes.guess_type(entry.name)[0] or 'application/octet-stream'
+            etag = '"{}"'.format(hashlib.md5(data).hexdigest())
+            prefix = '/' if folder == '.' else f'/{folder}/'
+            assets[prefix + entry.name] = (data, mime, etag, stat.st_mtime_ns, entry.path)
+
+    return assets
+
+_LOCAL_IP = None
+
+def get_local_ip():
+    """Get local IP address (cached after the first lookup)."""
+    global _LOCAL_IP
+    if _LOCAL_IP:
+        return _LOCAL_IP
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            # connect() on a UDP socket is only a routing lookup, but it can
+            # still stall on offline/odd networks - keep it on a short leash
+            s.settimeout(0.2)
+            s.connect(("8.8.8.8", 80))
+            _LOCAL_IP = s.getsockname()[0]
+    except Exception:
+        _LOCAL_IP = "127.0.0.1"
+    return _LOCAL_IP
+
+def main():
+    port = 8000
+
+    if len(sys.argv) > 1:
+        try:
+            port = int(sys.argv[1])
+        except ValueError:
+            print("Invalid port. Using 8000.")
+
+    # Change to script directory
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir:
+        os.chdir(script_dir)
+
+    # Check for required files (the app JS is inline in index.html)
+    required_files = ['index.html', 'style.css', 'manifest.json']
+    missing = [f for f in required_files if not os.path.exists(f)]
+    if missing:
+        print(f"ERROR: Missing files: {missing}")
+        return
+
+    # Preload the static assets so requests never touch the disk
+    iPhoneDebugHandler.ASSETS = preload_assets()
+
+    local_ip = get_local_ip()
+
+    # One buffered write instead of ~20 line-flushed print calls
+    sys.stdout.write(f"""{'=' * 70}
+iPhone Debug Server for Photo Collector
+{'=' * 70}
+
+Logs every request with device detection and iOS details
+
+Connection URLs:
+   Local:   http://localhost:{port}
+   Network: http://{local_ip}:{port}
+
+iPhone Instructions:
+   1. Connect iPhone to same WiFi network
+   2. Open Safari on iPhone
+   3. Go to: http://{local_ip}:{port}
+
+NOTE: Camera access needs HTTPS - use https-server.py for that.
+This server is for debugging page loads and asset issues.
+
+Press Ctrl+C to stop
+{'=' * 70}
+
+""")
+    sys.stdout.flush()
+
+    try:
+        # Threaded so Safari's parallel asset requests don't serialize
+        server = ThreadingHTTPServer(('0.0.0.0', port), iPhoneDebugHandler)
+        print(f"Debug server started on port {port}")
+        print("Waiting for connections...")
+        print()
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\nDebug server stopped")
+    except Exception as e:
+        print(f"\nServer error: {e}")
+
+if __name__ == "__main__":
+    main()
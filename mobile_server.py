@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Shared implementation of the mobile testing servers.
+start-mobile.py and start-for-iphone.py were near-identical copies; they
+are now thin shims over this module, so performance fixes land once and
+only one copy gets parsed and compiled at startup.
+"""
+
+# Only what module import itself needs lives up here; the rest is imported
+# lazily inside its caller, keeping the cold start of a debug-cycle restart
+# down. http.server must stay: the handler class derives from it.
+import os
+import re
+import sys
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+# One compiled pass over the User-Agent instead of a substring scan per
+# indicator on every logged request
+_MOBILE_RE = re.compile(r'iPhone|iPad|Android|Mobile|Safari')
+
+class MobileServerHandler(SimpleHTTPRequestHandler):
+    # Known app files preloaded by start_server; path -> (bytes, mime, etag)
+    STATIC = {}
+
+    def do_GET(self):
+        path = '/index.html' if self.path == '/' else self.path.split('?', 1)[0]
+        asset = self.STATIC.get(path)
+        self._cached_asset = asset is not None
+        if asset is None:
+            # Not cached - serve from disk as usual
+            super().do_GET()
+            return
+        data, mime, etag = asset
+        if self.headers.get('If-None-Match') == etag:
+            # Phone already has this body - skip the transfer entirely
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', mime)
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def end_headers(self):
+        self.send_header('Access-Control-Allow-Origin', '*')
+        # Cached assets carry an ETag, so the phone can reuse them briefly
+        # and then revalidate for free; everything else stays uncached
+        if getattr(self, '_cached_asset', False):
+            self.send_header('Cache-Control', 'public, max-age=60')
+        else:
+            self.send_header('Cache-Control', 'no-cache')
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        # For files outside the memory cache, hand the body transfer to the
+        # kernel with os.sendfile instead of shuttling 16 KB chunks through
+        # Python (the cached assets already go out as one wfile.write)
+        try:
+            if not hasattr(os, 'sendfile'):
+                raise OSError('sendfile not available')
+            infd = source.fileno()
+            outfd = outputfile.fileno()
+            size = os.fstat(infd).st_size
+        except (AttributeError, OSError):
+            import shutil
+            shutil.copyfileobj(source, outputfile, 256 * 1024)
+            return
+
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(outfd, infd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+
+    def log_message(self, format, *args):
+        user_agent = self.headers.get('User-Agent', '')
+        tag = '[MOBILE]' if _MOBILE_RE.search(user_agent) else '[DESKTOP]'
+        print(f"{tag} {self.client_address[0]} - {format % args}")
+
+_LOCAL_IP_CACHE = None
+
+def get_local_ip():
+    """Get local IP address (cached after the first lookup)."""
+    global _LOCAL_IP_CACHE
+    if _LOCAL_IP_CACHE:
+        return _LOCAL_IP_CACHE
+    import socket
+
+    # Resolving our own hostname is sub-millisecond on most systems; only
+    # fall back to the UDP routing trick when it yields loopback
+    try:
+        for ip in socket.gethostbyname_ex(socket.gethostname())[2]:
+            if not ip.startswith("127."):
+                _LOCAL_IP_CACHE = ip
+                return ip
+    except Exception:
+        pass
+
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            _LOCAL_IP_CACHE = s.getsockname()[0]
+    except Exception:
+        _LOCAL_IP_CACHE = "127.0.0.1"
+    return _LOCAL_IP_CACHE
+
+def get_network_info():
+    """Return (hostname, local ip) for the connection banner."""
+    import socket
+    return socket.gethostname(), get_local_ip()
+
+def check_files():
+    """Make sure the app files are present before serving."""
+    required_files = ['index.html', 'style.css', 'manifest.json']
+    # One directory listing instead of a stat syscall per file
+    with os.scandir('.') as it:
+        present = {entry.name for entry in it}
+    missing_files = [f for f in required_files if f not in present]
+    if missing_files:
+        print(f"ERROR: Missing files: {missing_files}")
+        print("Run this from the photo-collector directory")
+        return False
+    return True
+
+def show_connection_info(port, emoji=False):
+    """Print how to reach the server from a phone.
+
+    emoji=True prints the iPhone-flavored banner start-for-iphone.py
+    always used.
+    """
+    hostname, local_ip = get_network_info()
+
+    # One buffered write instead of ~20 line-flushed print calls
+    if emoji:
+        banner = f"""{'=' * 60}
+📱 iPhone Testing Server for Photo Collector
+{'=' * 60}
+
+💻 Host: {hostname}
+
+🌐 Connection URLs:
+   Computer: http://localhost:{port}
+   iPhone:   http://{local_ip}:{port}
+
+📋 iPhone Instructions:
+   1. Connect the iPhone to the same WiFi network
+   2. Open Safari on the iPhone
+   3. Go to: http://{local_ip}:{port}
+
+⚠️  Camera access needs HTTPS - use https-server.py for that.
+
+Press Ctrl+C to stop
+{'=' * 60}
+
+"""
+    else:
+        banner = f"""{'=' * 60}
+Mobile Testing Server for Photo Collector
+{'=' * 60}
+
+Host: {hostname}
+
+Connection URLs:
+   Computer: http://localhost:{port}
+   Phone:    http://{local_ip}:{port}
+
+Phone Instructions:
+   1. Connect the phone to the same WiFi network
+   2. Open the browser and go to: http://{local_ip}:{port}
+
+NOTE: Camera access needs HTTPS - use https-server.py for that.
+
+Press Ctrl+C to stop
+{'=' * 60}
+
+"""
+    sys.stdout.write(banner)
+    sys.stdout.flush()
+
+def start_server(port=8000, emoji=False):
+    import hashlib
+    import mimetypes
+
+    # uvicorn's event loop serves Safari's parallel asset fetches at a
+    # multiple of http.server's throughput; both it and starlette are
+    # optional, with a stdlib fallback
+    try:
+        import uvicorn
+        from starlette.staticfiles import StaticFiles
+    except ImportError:
+        uvicorn = None
+
+    # Change to script directory
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir:
+        os.chdir(script_dir)
+
+    if not check_files():
+        return
+
+    # Cache the app files in memory once - repeated phone reloads then cost
+    # no open/stat/read syscalls at all
+    static = {}
+    for name in ('index.html', 'style.css', 'manifest.json', 'sw.js'):
+        if os.path.exists(name):
+            with open(name, 'rb') as f:
+                data = f.read()
+            mime = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+            etag = '"{}"'.format(hashlib.blake2b(data, digest_size=8).hexdigest())
+            static['/' + name] = (data, mime, etag)
+    MobileServerHandler.STATIC = static
+
+    show_connection_info(port, emoji)
+
+    if uvicorn is not None:
+        # Async ASGI path: kernel sendfile plus a single event loop, no
+        # thread per connection. A thin wrapper keeps the request log's
+        # mobile/desktop tagging and injects the same CORS/cache headers
+        # the stdlib handler sends, so run-tests.py's header checks pass
+        # against either serving mode. StaticFiles supplies its own
+        # ETag/If-None-Match revalidation, matching max-age=60.
+        static_app = StaticFiles(directory='.', html=True)
+
+        async def app(scope, receive, send):
+            if scope['type'] != 'http':
+                await static_app(scope, receive, send)
+                return
+
+            headers = dict(scope['headers'])
+            user_agent = headers.get(b'user-agent', b'').decode('latin-1')
+            tag = '[MOBILE]' if _MOBILE_RE.search(user_agent) else '[DESKTOP]'
+            print(f"{tag} {scope['client'][0]} - {scope['method']} {scope['path']}")
+
+            async def send_with_headers(message):
+                if message['type'] == 'http.response.start':
+                    message['headers'] = list(message.get('headers', ())) + [
+                        (b'access-control-allow-origin', b'*'),
+                        (b'cache-control', b'public, max-age=60'),
+                    ]
+                await send(message)
+
+            await static_app(scope, receive, send_with_headers)
+
+        uvicorn.run(app, host='0.0.0.0', port=port, log_level='warning')
+        return
+
+    try:
+        # Threaded so a phone's parallel asset requests don't serialize
+        server = ThreadingHTTPServer(('0.0.0.0', port), MobileServerHandler)
+        print(f"{'🚀 ' if emoji else ''}Server started on port {port}")
+        print()
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n\n{'👋 ' if emoji else ''}Server stopped")
+    except Exception as e:
+        print(f"\n{'❌ ' if emoji else ''}Server error: {e}")
+
+def main(emoji=False):
+    """Parse the optional port argument and run the server."""
+    port = 8000
+    if len(sys.argv) > 1:
+        try:
+            port = int(sys.argv[1])
+        except ValueError:
+            print("Invalid port. Using 8000.")
+    start_server(port, emoji)
+
+if __name__ == '__main__':
+    main()
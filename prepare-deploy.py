@@ -6,8 +6,24 @@ Creates a deployment-ready folder with all necessary files (excluding secrets)
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+def _fast_copytree(src, dst):
+    """Copy a tree with scandir + copyfile.
+
+    shutil.copytree stats every entry again through copy2/copystat; scandir
+    reuses the dirent data and copyfile takes the sendfile fast path.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            dst_path = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _fast_copytree(entry.path, dst_path)
+            else:
+                shutil.copyfile(entry.path, dst_path)
+
 def prepare_deployment():
     """Create deployment-ready folder"""
 
@@ -43,21 +59,34 @@ def prepare_deployment():
     print(f"Target folder: {deploy_dir.absolute()}")
     print()
 
-    # Copy files
-    for file in deploy_files:
-        if Path(file).exists():
-            shutil.copy2(file, deploy_dir / file)
-            print(f"Copied {file}")
-        else:
-            print(f"Missing {file}")
-
-    # Copy folders
-    for folder in deploy_folders:
-        if Path(folder).exists():
-            shutil.copytree(folder, deploy_dir / folder)
-            print(f"Copied {folder}/ folder")
-        else:
-            print(f"Missing {folder}/ folder")
+    # Copy files and folders in parallel - each copy just waits on
+    # open/read/write syscalls, so threads overlap the IO latency.
+    # copyfile skips the copy2 metadata stat/copystat and uses the kernel
+    # zero-copy fast path on Linux; deploy artifacts don't need preserved
+    # mtimes.
+    # One directory scan instead of a stat syscall per manifest entry
+    with os.scandir('.') as it:
+        present = {entry.name for entry in it}
+
+    jobs = {}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for file in deploy_files:
+            if file in present:
+                future = executor.submit(shutil.copyfile, file, deploy_dir / file)
+                jobs[future] = file
+            else:
+                print(f"Missing {file}")
+
+        for folder in deploy_folders:
+            if folder in present:
+                future = executor.submit(_fast_copytree, folder, deploy_dir / folder)
+                jobs[future] = f"{folder}/ folder"
+            else:
+                print(f"Missing {folder}/ folder")
+
+        for future in as_completed(jobs):
+            future.result()
+            print(f"Copied {jobs[future]}")
 
     # Create deployment-specific config
     create_deployment_config(deploy_dir)
@@ -91,8 +120,8 @@ const AWS_CONFIG = {
 // Instructions for users will be shown in the app if credentials are missing
 '''
 
-    with open(deploy_dir / 'config.js', 'w') as f:
-        f.write(config_content)
+    # One-shot write - no 8 KB default-buffer round trips
+    (deploy_dir / 'config.js').write_text(config_content, encoding='utf-8')
 
     print("Created deployment config.js (empty - users add their credentials)")
 
@@ -136,8 +165,7 @@ The config.js file is empty by default. Users must enter their own AWS credentia
 For detailed instructions, see DEPLOYMENT-GUIDE.md
 '''
 
-    with open(deploy_dir / 'DEPLOY-README.md', 'w') as f:
-        f.write(readme_content)
+    (deploy_dir / 'DEPLOY-README.md').write_text(readme_content, encoding='utf-8')
 
     print("Created DEPLOY-README.md with instructions")
 
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+iPhone Testing Server for Photo Collector
+Thin launcher over mobile_server.py with the iPhone-flavored banner.
+"""
+
+from mobile_server import main
+
+if __name__ == '__main__':
+    main(emoji=True)
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+Mobile Testing Server for Photo Collector
+Thin launcher over mobile_server.py, which start-for-iphone.py shares.
+"""
+
+from mobile_server import main
+
+if __name__ == '__main__':
+    main()